@@ -11,6 +11,10 @@ public final class AppDelegate: NSObject, NSApplicationDelegate, NSWindowDelegat
         NSApp.setActivationPolicy(.regular)
     }
 
+    public func applicationWillTerminate(_ notification: Notification) {
+        runtime?.flushPendingConfigSave()
+    }
+
     public func applicationShouldHandleReopen(_ sender: NSApplication, hasVisibleWindows flag: Bool) -> Bool {
         window?.makeKeyAndOrderFront(nil)
         NSApp.activate(ignoringOtherApps: true)
@@ -34,7 +34,9 @@ public final class AppRuntime: ObservableObject {
 
     private var statusBarController: StatusBarController?
     private var meterTimer: Timer?
+    private var pendingIndicatorSave: DispatchWorkItem?
     private var didRunLaunchPermissionPrompt = false
+    private var permissionCheckGeneration = 0
 
     public init() {
         configStore = JSONConfigStore()
@@ -46,7 +48,9 @@ public final class AppRuntime: ObservableObject {
         permissionService = PermissionService(inserter: inserter)
         hotkeyService = HotkeyService()
         audioService = AudioCaptureService()
-        sttService = WhisperKitTranscriptionService()
+        sttService = WhisperKitTranscriptionService(languageModeProvider: { [weak configStore] in
+            ((try? configStore?.load()) ?? AppConfig()).languageMode
+        })
         cleanupService = CleanupService(configProvider: { [weak configStore] in
             (try? configStore?.load()) ?? AppConfig()
         }, secretStore: secretStore)
@@ -72,7 +76,8 @@ public final class AppRuntime: ObservableObject {
         }
 
         setupHotkeys()
-        refreshPermissions()
+        // Synchronous once at launch: the permission prompt below depends on it.
+        applyPermissionState(permissionService.checkAll())
         reloadHistory()
         refreshRuntimeUIState()
         runLaunchPermissionPromptIfNeeded()
@@ -83,17 +88,48 @@ public final class AppRuntime: ObservableObject {
             return
         }
         statusBarController = StatusBarController(runtime: self, onOpen: openAction)
-        statusBarController?.rebuildMenu()
     }
 
     public func setIndicatorPosition(x: Double, y: Double) {
         config.floatingIndicatorOriginX = x
         config.floatingIndicatorOriginY = y
+        // windowDidMove fires for every drag step; write once the panel settles.
+        pendingIndicatorSave?.cancel()
+        let task = DispatchWorkItem { [weak self] in
+            self?.flushPendingConfigSave()
+        }
+        pendingIndicatorSave = task
+        DispatchQueue.main.asyncAfter(deadline: .now() + 0.25, execute: task)
+    }
+
+    /// Writes a debounced indicator position now, if one is still pending.
+    public func flushPendingConfigSave() {
+        guard pendingIndicatorSave != nil else { return }
         saveConfig()
     }
 
+    /// Runs the permission probes off the main actor (the Automation probe
+    /// spawns osascript) and applies the result when it arrives.
     public func refreshPermissions() {
-        permissionState = permissionService.checkAll()
+        permissionCheckGeneration += 1
+        let generation = permissionCheckGeneration
+        let service = permissionService
+        Task.detached(priority: .userInitiated) { [weak self] in
+            let latest = service.checkAll()
+            await self?.applyPermissionState(latest, generation: generation)
+        }
+    }
+
+    private func applyPermissionState(_ latest: PermissionState, generation: Int? = nil) {
+        // A newer refresh was requested while this one ran; let that one win.
+        if let generation, generation != permissionCheckGeneration {
+            return
+        }
+        // @Published notifies on every assignment, so only publish a real change;
+        // otherwise each Re-check re-renders every permission row for nothing.
+        if latest != permissionState {
+            permissionState = latest
+        }
         refreshRuntimeUIState()
         AppLogger.info("Permissions refreshed: mic=\(permissionState.microphone) ax=\(permissionState.accessibility) im=\(permissionState.inputMonitoring) auto=\(permissionState.automation)")
     }
@@ -135,8 +171,16 @@ public final class AppRuntime: ObservableObject {
     }
 
     public func reloadHistory() {
-        history = (try? historyStore.search(query: historyQuery, limit: 250, offset: 0)) ?? []
-        historyStats = (try? historyStore.stats()) ?? historyStats
+        let records = (try? historyStore.search(query: historyQuery, limit: 250, beforeID: nil)) ?? []
+        let stats = (try? historyStore.stats()) ?? historyStats
+        // ForEach already diffs rows by id; skipping identical publishes also
+        // spares the list and stats views a needless invalidation.
+        if records != history {
+            history = records
+        }
+        if stats != historyStats {
+            historyStats = stats
+        }
     }
 
     public func deleteHistory(_ record: HistoryRecord) {
@@ -158,7 +202,8 @@ public final class AppRuntime: ObservableObject {
     public func setHotkeyMode(_ mode: HotkeyMode) {
         config.hotkeyMode = mode
         saveConfig()
-        setupHotkeys()
+        guard serviceEnabled else { return }
+        hotkeyService.start(mode: mode)
     }
 
     public func setLanguageMode(_ mode: LanguageMode) {
@@ -274,6 +319,9 @@ public final class AppRuntime: ObservableObject {
     }
 
     private func saveConfig() {
+        // This write includes any pending indicator position.
+        pendingIndicatorSave?.cancel()
+        pendingIndicatorSave = nil
         try? configStore.save(config)
         refreshRuntimeUIState()
     }
@@ -320,8 +368,11 @@ public final class AppRuntime: ObservableObject {
     }
 
     private func refreshRuntimeUIState() {
-        requiresPermissionOnboarding = !permissionState.allGranted
-        statusBarController?.rebuildMenu()
+        let needsOnboarding = !permissionState.allGranted
+        if requiresPermissionOnboarding != needsOnboarding {
+            requiresPermissionOnboarding = needsOnboarding
+        }
+        statusBarController?.refreshMenu()
     }
 
     private func runLaunchPermissionPromptIfNeeded() {
@@ -357,17 +408,25 @@ public final class AppRuntime: ObservableObject {
 
     private func startMeterUpdates() {
         stopMeterUpdates()
+        // Scheduled from the main actor, so the timer fires on the main run loop;
+        // handle the tick inline instead of allocating a Task per fire.
         meterTimer = Timer.scheduledTimer(withTimeInterval: 0.05, repeats: true) { [weak self] _ in
-            Task { @MainActor [weak self] in
-                guard let self else { return }
-                guard self.state == .recording else { return }
-                let level = self.audioService.currentLiveLevel()
-                self.audioLevel = level
-                self.updateIndicator(.recording(level: level))
+            MainActor.assumeIsolated {
+                self?.meterTick()
             }
         }
     }
 
+    private func meterTick() {
+        guard state == .recording else { return }
+        let level = audioService.currentLiveLevel()
+        audioLevel = level
+        // A disabled indicator was already hidden when the setting changed;
+        // don't re-hide it on every tick.
+        guard config.floatingIndicatorEnabled else { return }
+        indicator.update(state: .recording(level: level))
+    }
+
     private func stopMeterUpdates() {
         meterTimer?.invalidate()
         meterTimer = nil
@@ -1,4 +1,5 @@
 import AppKit
+import Domain
 import Foundation
 
 @MainActor
@@ -7,43 +8,58 @@ final class StatusBarController {
     private weak var runtime: AppRuntime?
     private let onOpen: () -> Void
 
+    // Built once; refreshMenu() only retitles the items that reflect runtime state.
+    private let statusItem = NSMenuItem(title: "", action: nil, keyEquivalent: "")
+    private let permissionsItem = NSMenuItem(title: "", action: nil, keyEquivalent: "")
+    private let toggleItem = NSMenuItem(title: "", action: nil, keyEquivalent: "")
+    private var lastMenuState: (state: ServiceState, allGranted: Bool, serviceEnabled: Bool)?
+
     init(runtime: AppRuntime, onOpen: @escaping () -> Void) {
         self.runtime = runtime
         self.onOpen = onOpen
         self.item = NSStatusBar.system.statusItem(withLength: NSStatusItem.variableLength)
         item.button?.title = "SF"
-        rebuildMenu()
+        item.menu = makeMenu()
+        refreshMenu()
     }
 
-    func rebuildMenu() {
+    private func makeMenu() -> NSMenu {
         let menu = NSMenu(title: "SpeakFlow")
 
         let open = NSMenuItem(title: "Open SpeakFlow", action: #selector(openMain), keyEquivalent: "")
         open.target = self
         menu.addItem(open)
 
-        let runtimeState = runtime?.state.rawValue ?? "Idle"
-        let status = NSMenuItem(title: "Status: \(runtimeState)", action: nil, keyEquivalent: "")
-        menu.addItem(status)
-
-        let perms = NSMenuItem(
-            title: (runtime?.permissionState.allGranted ?? false) ? "Permissions: Ready" : "Permissions: Missing",
-            action: nil,
-            keyEquivalent: ""
-        )
-        menu.addItem(perms)
+        menu.addItem(statusItem)
+        menu.addItem(permissionsItem)
 
-        let toggleTitle = (runtime?.serviceEnabled ?? false) ? "Stop Service" : "Start Service"
-        let toggle = NSMenuItem(title: toggleTitle, action: #selector(toggleService), keyEquivalent: "")
-        toggle.target = self
-        menu.addItem(toggle)
+        toggleItem.action = #selector(toggleService)
+        toggleItem.target = self
+        menu.addItem(toggleItem)
 
         menu.addItem(NSMenuItem.separator())
         let quit = NSMenuItem(title: "Quit", action: #selector(quitApp), keyEquivalent: "q")
         quit.target = self
         menu.addItem(quit)
 
-        item.menu = menu
+        return menu
+    }
+
+    func refreshMenu() {
+        let current = (
+            state: runtime?.state ?? .idle,
+            allGranted: runtime?.permissionState.allGranted ?? false,
+            serviceEnabled: runtime?.serviceEnabled ?? false
+        )
+        // Most refreshes (config saves, history reloads) leave all three unchanged.
+        if let lastMenuState, lastMenuState == current {
+            return
+        }
+        lastMenuState = current
+
+        statusItem.title = "Status: \(current.state.rawValue)"
+        permissionsItem.title = current.allGranted ? "Permissions: Ready" : "Permissions: Missing"
+        toggleItem.title = current.serviceEnabled ? "Stop Service" : "Start Service"
     }
 
     @objc private func openMain() {
@@ -53,7 +69,7 @@ final class StatusBarController {
     @objc private func toggleService() {
         guard let runtime else { return }
         runtime.setServiceEnabled(!runtime.serviceEnabled)
-        rebuildMenu()
+        refreshMenu()
     }
 
     @objc private func quitApp() {
@@ -7,6 +7,9 @@ struct AudioVisualizerView: View {
     let isActive: Bool
 
     @State private var barHeights: [CGFloat] = []
+    /// Per-bar center-weighted taper; depends only on `barCount`, so it is
+    /// computed on appear rather than on every level update.
+    @State private var barTapers: [CGFloat] = []
 
     init(level: Float, barCount: Int = 24, isActive: Bool = true) {
         self.level = level
@@ -30,6 +33,7 @@ struct AudioVisualizerView: View {
         }
         .onAppear {
             barHeights = Array(repeating: 4, count: barCount)
+            barTapers = Self.tapers(barCount: barCount)
         }
     }
 
@@ -50,20 +54,23 @@ struct AudioVisualizerView: View {
         }
     }
 
-    private func updateBars(level: Float) {
-        let clamped = CGFloat(min(max(level, 0), 1))
-        var newHeights = [CGFloat]()
+    private static func tapers(barCount: Int) -> [CGFloat] {
         let center = barCount / 2
-
-        for i in 0..<barCount {
-            let distFromCenter = abs(CGFloat(i - center)) / CGFloat(center)
+        return (0..<barCount).map { i in
+            let distFromCenter = abs(CGFloat(i - center)) / CGFloat(max(center, 1))
             // Bars near center are taller; edges taper off
-            let taper = 1.0 - (distFromCenter * 0.6)
-            // Add some randomness for organic feel
-            let jitter = CGFloat.random(in: 0.7...1.0)
-            let height = max(4, clamped * 48 * taper * jitter)
-            newHeights.append(height)
+            return 1.0 - (distFromCenter * 0.6)
+        }
+    }
+
+    private func updateBars(level: Float) {
+        if barTapers.count != barCount {
+            barTapers = Self.tapers(barCount: barCount)
+        }
+        let scale = CGFloat(min(max(level, 0), 1)) * 48
+        // Add some randomness for organic feel
+        barHeights = barTapers.map { taper in
+            max(4, scale * taper * CGFloat.random(in: 0.7...1.0))
         }
-        barHeights = newHeights
     }
 }
@@ -167,18 +167,56 @@ private struct HistoryRow: View {
         }
     }
 
-    private func displayTimestamp(_ raw: String) -> String {
+    private static let timestampParser = ISO8601DateFormatter()
+    private static let fractionalTimestampParser: ISO8601DateFormatter = {
         let parser = ISO8601DateFormatter()
         parser.formatOptions = [.withInternetDateTime, .withFractionalSeconds]
-        let parserFallback = ISO8601DateFormatter()
-        if let date = parser.date(from: raw) ?? parserFallback.date(from: raw) {
-            let f = DateFormatter()
-            f.locale = .current
-            f.timeZone = .current
-            f.dateStyle = .medium
-            f.timeStyle = .short
-            return f.string(from: date)
+        return parser
+    }()
+
+    /// Resolves the time zone and locale once; the autoupdating values still
+    /// follow system changes.
+    private static let displayFormatter: DateFormatter = {
+        let formatter = DateFormatter()
+        formatter.locale = .autoupdatingCurrent
+        formatter.timeZone = .autoupdatingCurrent
+        formatter.dateStyle = .medium
+        formatter.timeStyle = .short
+        return formatter
+    }()
+
+    /// Rows are re-rendered on every selection change and scroll; each raw
+    /// timestamp is parsed and formatted once, until the time zone or locale
+    /// changes (see `displayTimestampInvalidators`).
+    private static var displayTimestamps: [String: String] = [:]
+
+    /// Installed on first use; drops the formatted strings so they follow
+    /// the autoupdating formatter like uncached rendering would.
+    private static let displayTimestampInvalidators: [NSObjectProtocol] = [
+        Notification.Name.NSSystemTimeZoneDidChange,
+        NSLocale.currentLocaleDidChangeNotification,
+    ].map { name in
+        NotificationCenter.default.addObserver(forName: name, object: nil, queue: .main) { _ in
+            MainActor.assumeIsolated {
+                HistoryRow.displayTimestamps.removeAll()
+            }
+        }
+    }
+
+    private func displayTimestamp(_ raw: String) -> String {
+        _ = Self.displayTimestampInvalidators
+        if let cached = Self.displayTimestamps[raw] {
+            return cached
+        }
+        // The history store writes whole seconds, so that shape is tried first.
+        guard let date = Self.timestampParser.date(from: raw) ?? Self.fractionalTimestampParser.date(from: raw) else {
+            return raw
+        }
+        if Self.displayTimestamps.count >= 4_096 {
+            Self.displayTimestamps.removeAll(keepingCapacity: true)
         }
-        return raw
+        let display = Self.displayFormatter.string(from: date)
+        Self.displayTimestamps[raw] = display
+        return display
     }
 }
@@ -14,7 +14,7 @@ public protocol SecretStoreProtocol: Sendable {
 
 public protocol HistoryStoreProtocol: Sendable {
     func add(rawText: String, finalText: String, detectedLanguage: String?, confidence: Double?, outputMode: String, sourceApp: String?) throws
-    func search(query: String, limit: Int, offset: Int) throws -> [HistoryRecord]
+    func search(query: String, limit: Int, beforeID: Int?) throws -> [HistoryRecord]
     func delete(id: Int) throws
     func stats() throws -> HistoryStats
 }
@@ -1,19 +1,43 @@
+import Accelerate
 import AVFoundation
 import Domain
 import Foundation
+import Synchronization
 
 public final class AudioCaptureService: AudioCaptureServiceProtocol, @unchecked Sendable {
     private let engine = AVAudioEngine()
     private let lock = NSLock()
-    private var bufferedSamples: [Float] = []
-    private var liveLevel: Float = 0
+    private let sampleStorage: UnsafeMutableBufferPointer<Float>
+    private let writeIndex = Atomic<Int>(0)
+    private let overflowed = Atomic<Bool>(false)
+    private let liveLevelBits = Atomic<UInt32>(0)
     private var recording = false
 
     private let targetSampleRate: Double = 16_000
     private let silenceThreshold: Float = 0.0137 // ~450/32768
-    private let silencePaddingSeconds: Double = 0.12
+    private var silencePaddingSamples: Int { Int(0.12 * targetSampleRate) }
+
+    // Preallocated once so the tap callback never grows an array; 10 minutes at
+    // 16 kHz. Pages are only committed as samples are written, and stopRecording
+    // hands them back, so an idle app keeps the address range but not the memory.
+    private static let maxBufferedSamples = 16_000 * 600
+
+    public init() {
+        // Page-aligned so stopRecording can madvise the written range away.
+        let raw = UnsafeMutableRawPointer.allocate(
+            byteCount: Self.maxBufferedSamples * MemoryLayout<Float>.stride,
+            alignment: Int(getpagesize())
+        )
+        sampleStorage = UnsafeMutableBufferPointer(
+            start: raw.bindMemory(to: Float.self, capacity: Self.maxBufferedSamples),
+            count: Self.maxBufferedSamples
+        )
+    }
 
-    public init() {}
+    deinit {
+        // Freed through the raw pointer, matching the over-aligned allocation.
+        UnsafeMutableRawPointer(sampleStorage.baseAddress!).deallocate()
+    }
 
     public func startRecording() throws {
         lock.lock()
@@ -21,7 +45,8 @@ public final class AudioCaptureService: AudioCaptureServiceProtocol, @unchecked
             lock.unlock()
             return
         }
-        bufferedSamples.removeAll(keepingCapacity: true)
+        writeIndex.store(0, ordering: .relaxed)
+        overflowed.store(false, ordering: .relaxed)
         liveLevel = 0
         recording = true
         lock.unlock()
@@ -55,13 +80,21 @@ public final class AudioCaptureService: AudioCaptureServiceProtocol, @unchecked
         engine.inputNode.removeTap(onBus: 0)
         engine.stop()
 
-        lock.lock()
-        let samples = bufferedSamples
-        bufferedSamples.removeAll(keepingCapacity: false)
+        let end = writeIndex.load(ordering: .acquiring)
         liveLevel = 0
-        lock.unlock()
+        if overflowed.load(ordering: .relaxed) {
+            // Logged here rather than from the real-time tap callback.
+            AppLogger.error("Recording exceeded \(Self.maxBufferedSamples / Int(targetSampleRate)) s; audio past that point was dropped.")
+        }
 
-        return trimSilence(samples)
+        let samples = trimSilence(UnsafeBufferPointer(start: sampleStorage.baseAddress, count: end))
+        // The buffer itself is never freed while the service lives, so a tap
+        // callback still in flight writes into valid memory; only its pages go back.
+        writeIndex.store(0, ordering: .relaxed)
+        if end > 0 {
+            madvise(sampleStorage.baseAddress, end * MemoryLayout<Float>.stride, MADV_FREE)
+        }
+        return samples
     }
 
     public func isRecording() -> Bool {
@@ -71,15 +104,17 @@ public final class AudioCaptureService: AudioCaptureServiceProtocol, @unchecked
     }
 
     public func currentLiveLevel() -> Float {
-        lock.lock()
-        defer { lock.unlock() }
-        return liveLevel
+        liveLevel
     }
 
     public func resetLiveLevel() {
-        lock.lock()
         liveLevel = 0
-        lock.unlock()
+    }
+
+    // Smoothed by the tap callback, read by the UI meter; relaxed ordering is enough.
+    private var liveLevel: Float {
+        get { Float(bitPattern: liveLevelBits.load(ordering: .relaxed)) }
+        set { liveLevelBits.store(newValue.bitPattern, ordering: .relaxed) }
     }
 
     private func handleBuffer(_ buffer: AVAudioPCMBuffer) {
@@ -88,46 +123,73 @@ public final class AudioCaptureService: AudioCaptureServiceProtocol, @unchecked
         if frameCount == 0 { return }
 
         let source = UnsafeBufferPointer(start: channelData[0], count: frameCount)
-        var chunk = Array(source)
+        let rms = vDSP.rootMeanSquare(source)
+        liveLevel = min(1.0, max(0.0, (liveLevel * 0.6) + (rms * 6.0 * 0.4)))
 
+        // Single producer (tap) / single consumer (stopRecording): samples are
+        // written straight into storage, then the new end index is published.
+        let start = writeIndex.load(ordering: .relaxed)
+        let free = UnsafeMutableBufferPointer(rebasing: sampleStorage[start...])
+        guard !free.isEmpty else {
+            overflowed.store(true, ordering: .relaxed)
+            return
+        }
+
+        let written: Int
         let sampleRate = buffer.format.sampleRate
         if abs(sampleRate - targetSampleRate) > 0.5 {
-            chunk = downsampleLinear(chunk, from: sampleRate, to: targetSampleRate)
+            written = downsampleLinear(source, from: sampleRate, to: targetSampleRate, into: free)
+        } else {
+            written = copySamples(source, into: free)
         }
-
-        let rms = sqrt(chunk.reduce(0) { $0 + ($1 * $1) } / Float(max(chunk.count, 1)))
-
-        lock.lock()
-        bufferedSamples.append(contentsOf: chunk)
-        liveLevel = min(1.0, max(0.0, (liveLevel * 0.6) + (rms * 6.0 * 0.4)))
-        lock.unlock()
+        if written == free.count {
+            // Storage filled up, possibly mid-buffer.
+            overflowed.store(true, ordering: .relaxed)
+        }
+        writeIndex.store(start + written, ordering: .releasing)
     }
 
-    private func downsampleLinear(_ input: [Float], from: Double, to: Double) -> [Float] {
-        guard !input.isEmpty, from > to else { return input }
+    private func downsampleLinear(
+        _ input: UnsafeBufferPointer<Float>,
+        from: Double,
+        to: Double,
+        into output: UnsafeMutableBufferPointer<Float>
+    ) -> Int {
         let ratio = from / to
         let outCount = Int(Double(input.count) / ratio)
-        guard outCount > 1 else { return input }
-        var output: [Float] = []
-        output.reserveCapacity(outCount)
-        for i in 0..<outCount {
+        guard from > to, outCount > 1 else {
+            return copySamples(input, into: output)
+        }
+        let count = min(outCount, output.count)
+        for i in 0..<count {
             let src = Double(i) * ratio
             let low = Int(src)
             let high = min(low + 1, input.count - 1)
             let frac = Float(src - Double(low))
-            output.append(input[low] + ((input[high] - input[low]) * frac))
+            output[i] = input[low] + ((input[high] - input[low]) * frac)
         }
-        return output
+        return count
     }
 
-    private func trimSilence(_ samples: [Float]) -> [Float] {
+    private func copySamples(_ input: UnsafeBufferPointer<Float>, into output: UnsafeMutableBufferPointer<Float>) -> Int {
+        let count = min(input.count, output.count)
+        guard count > 0, let src = input.baseAddress, let dst = output.baseAddress else { return 0 }
+        dst.initialize(from: src, count: count)
+        return count
+    }
+
+    private func trimSilence(_ samples: UnsafeBufferPointer<Float>) -> [Float] {
         guard !samples.isEmpty else { return [] }
-        let voiced = samples.enumerated().compactMap { abs($0.element) > silenceThreshold ? $0.offset : nil }
-        guard let first = voiced.first, let last = voiced.last else { return [] }
+        let threshold = silenceThreshold
+        guard
+            let first = samples.firstIndex(where: { abs($0) > threshold }),
+            let last = samples.lastIndex(where: { abs($0) > threshold })
+        else {
+            return []
+        }
 
-        let pad = Int(silencePaddingSeconds * targetSampleRate)
-        let start = max(0, first - pad)
-        let end = min(samples.count - 1, last + pad)
+        let start = max(0, first - silencePaddingSamples)
+        let end = min(samples.count - 1, last + silencePaddingSamples)
         guard start <= end else { return [] }
         return Array(samples[start...end])
     }
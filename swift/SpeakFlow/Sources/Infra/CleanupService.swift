@@ -5,6 +5,12 @@ public final class CleanupService: CleanupServiceProtocol, @unchecked Sendable {
     private let configProvider: @Sendable () -> AppConfig
     private let secretStore: SecretStoreProtocol
     private let session: URLSession
+    private let encoder = JSONEncoder()
+    private let decoder = JSONDecoder()
+
+    private static let metaResponsePrefixes = ["certainly", "here", "cleaned"]
+    private static let metaPrefixScanLength = 10
+    private static let hinglishKeepWords: Set<String> = ["bhai", "kya", "kaise", "nahi", "hai", "haan", "yaar", "aap", "tum"]
 
     public init(
         configProvider: @escaping @Sendable () -> AppConfig,
@@ -37,6 +43,7 @@ public final class CleanupService: CleanupServiceProtocol, @unchecked Sendable {
             providers.append("lmstudio")
         }
 
+        let sourceTokens = tokens(in: deterministic)
         for provider in providers {
             let rewritten = await rewrite(
                 provider: provider,
@@ -44,7 +51,7 @@ public final class CleanupService: CleanupServiceProtocol, @unchecked Sendable {
                 mode: mode,
                 config: config
             )
-            let validated = validateRewrite(original: deterministic, rewritten: rewritten, outputMode: mode)
+            let validated = validateRewrite(sourceTokens: sourceTokens, rewritten: rewritten, outputMode: mode)
             if let validated {
                 AppLogger.info("Cleanup rewrite provider used: \(provider).")
                 return CleanupResult(text: validated, outputMode: mode, rewriteProvider: provider)
@@ -112,17 +119,17 @@ public final class CleanupService: CleanupServiceProtocol, @unchecked Sendable {
         guard let selectedModel, !selectedModel.isEmpty else { return nil }
 
         let prompt = buildSystemPrompt(mode: mode)
-        let body: [String: Any] = [
-            "model": selectedModel,
-            "temperature": 0,
-            "max_tokens": max(40, min(180, (text.split(separator: " ").count * 4) + 20)),
-            "messages": [
-                ["role": "system", "content": prompt],
-                ["role": "user", "content": text],
-            ],
-        ]
-
-        guard let payload = try? JSONSerialization.data(withJSONObject: body) else {
+        let body = ChatCompletionRequest(
+            model: selectedModel,
+            temperature: 0,
+            maxTokens: max(40, min(180, (text.split(separator: " ").count * 4) + 20)),
+            messages: [
+                .init(role: "system", content: prompt),
+                .init(role: "user", content: text),
+            ]
+        )
+
+        guard let payload = try? encoder.encode(body) else {
             return nil
         }
 
@@ -140,13 +147,8 @@ public final class CleanupService: CleanupServiceProtocol, @unchecked Sendable {
             guard let http = response as? HTTPURLResponse, (200..<300).contains(http.statusCode) else {
                 return nil
             }
-            guard
-                let json = try JSONSerialization.jsonObject(with: data) as? [String: Any],
-                let choices = json["choices"] as? [[String: Any]],
-                let first = choices.first,
-                let message = first["message"] as? [String: Any],
-                let content = message["content"] as? String
-            else {
+            let decoded = try decoder.decode(ChatCompletionResponse.self, from: data)
+            guard let content = decoded.choices.first?.message.content else {
                 return nil
             }
             return content.trimmingCharacters(in: .whitespacesAndNewlines)
@@ -183,49 +185,42 @@ public final class CleanupService: CleanupServiceProtocol, @unchecked Sendable {
             guard let http = response as? HTTPURLResponse, (200..<300).contains(http.statusCode) else {
                 return nil
             }
-            guard
-                let json = try JSONSerialization.jsonObject(with: data) as? [String: Any],
-                let dataList = json["data"] as? [[String: Any]],
-                let first = dataList.first,
-                let id = first["id"] as? String
-            else {
-                return nil
-            }
-            return id
+            let decoded = try decoder.decode(ModelListResponse.self, from: data)
+            return decoded.data.first?.id
         } catch {
             return nil
         }
     }
 
-    private func buildSystemPrompt(mode: String) -> String {
-        if mode == "hinglish_roman" {
-            return """
-            You are a strict dictation text normalizer.
-            Output Roman Hinglish only. Do not translate Hindi words to English.
-            Only fix spacing, punctuation, casing, and stretched letters.
-            Return one plain line only.
-            """
-        }
-        return """
+    private static let hinglishSystemPrompt = """
+        You are a strict dictation text normalizer.
+        Output Roman Hinglish only. Do not translate Hindi words to English.
+        Only fix spacing, punctuation, casing, and stretched letters.
+        Return one plain line only.
+        """
+
+    private static let englishSystemPrompt = """
         You are a strict dictation text normalizer.
         Keep same wording; do not paraphrase.
         Only fix spacing, punctuation, and casing.
         Return one plain line only.
         """
+
+    private func buildSystemPrompt(mode: String) -> String {
+        mode == "hinglish_roman" ? Self.hinglishSystemPrompt : Self.englishSystemPrompt
     }
 
-    private func validateRewrite(original: String, rewritten: String?, outputMode: String) -> String? {
+    private func validateRewrite(sourceTokens: [String], rewritten: String?, outputMode: String) -> String? {
         guard let rewritten else { return nil }
         var candidate = rewritten.replacingOccurrences(of: "\n", with: " ")
         candidate = LanguageNormalizer.collapseSpace(candidate)
         guard !candidate.isEmpty else { return nil }
 
-        let lowered = candidate.lowercased()
-        if lowered.hasPrefix("certainly") || lowered.hasPrefix("here") || lowered.hasPrefix("cleaned") {
+        let head = candidate.prefix(Self.metaPrefixScanLength).lowercased()
+        if Self.metaResponsePrefixes.contains(where: { head.hasPrefix($0) }) {
             return nil
         }
 
-        let sourceTokens = tokens(in: original)
         let targetTokens = tokens(in: candidate)
         guard !targetTokens.isEmpty else { return nil }
 
@@ -236,9 +231,8 @@ public final class CleanupService: CleanupServiceProtocol, @unchecked Sendable {
         }
 
         if outputMode == "hinglish_roman" {
-            let keepWords: Set<String> = ["bhai", "kya", "kaise", "nahi", "hai", "haan", "yaar", "aap", "tum"]
-            let sourceHas = !keepWords.intersection(Set(sourceTokens)).isEmpty
-            if sourceHas && keepWords.intersection(Set(targetTokens)).isEmpty {
+            let keepWords = Self.hinglishKeepWords
+            if !keepWords.isDisjoint(with: sourceTokens) && keepWords.isDisjoint(with: targetTokens) {
                 return nil
             }
         }
@@ -253,7 +247,48 @@ public final class CleanupService: CleanupServiceProtocol, @unchecked Sendable {
     private func overlapRatio(source: [String], target: [String]) -> Double {
         guard !source.isEmpty else { return 1.0 }
         let sourceSet = Set(source)
-        let kept = target.filter { sourceSet.contains($0) }.count
+        let kept = target.reduce(into: 0) { count, token in
+            if sourceSet.contains(token) { count += 1 }
+        }
         return Double(kept) / Double(source.count)
     }
 }
+
+private struct ChatCompletionRequest: Encodable {
+    struct Message: Encodable {
+        var role: String
+        var content: String
+    }
+
+    var model: String
+    var temperature: Int
+    var maxTokens: Int
+    var messages: [Message]
+
+    enum CodingKeys: String, CodingKey {
+        case model
+        case temperature
+        case maxTokens = "max_tokens"
+        case messages
+    }
+}
+
+private struct ChatCompletionResponse: Decodable {
+    struct Choice: Decodable {
+        struct Message: Decodable {
+            var content: String?
+        }
+
+        var message: Message
+    }
+
+    var choices: [Choice]
+}
+
+private struct ModelListResponse: Decodable {
+    struct Model: Decodable {
+        var id: String
+    }
+
+    var data: [Model]
+}
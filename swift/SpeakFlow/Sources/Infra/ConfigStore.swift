@@ -1,9 +1,11 @@
 import Domain
 import Foundation
 
-public final class JSONConfigStore: ConfigStoreProtocol {
+public final class JSONConfigStore: ConfigStoreProtocol, @unchecked Sendable {
     private let path: URL
     private let lock = NSLock()
+    private var lastPersisted: AppConfig?
+    private var lastSyncedModificationDate: Date?
 
     public init(path: URL = SpeakFlowPaths.configJSON) {
         self.path = path
@@ -13,10 +15,17 @@ public final class JSONConfigStore: ConfigStoreProtocol {
         lock.lock()
         defer { lock.unlock() }
 
+        let modified = modificationDate()
+        if let cached = lastPersisted, let modified, modified == lastSyncedModificationDate {
+            return cached
+        }
+
         try ensureAppSupportDirectories()
         guard FileManager.default.fileExists(atPath: path.path) else {
             let cfg = AppConfig()
             try saveUnlocked(cfg, preserve: [:])
+            lastPersisted = cfg
+            lastSyncedModificationDate = modificationDate()
             return cfg
         }
 
@@ -43,6 +52,8 @@ public final class JSONConfigStore: ConfigStoreProtocol {
         if let value = obj["paste_last_shortcut_enabled"] as? Bool { cfg.pasteLastShortcutEnabled = value }
         if let value = obj["paste_failure_keep_dictation_in_clipboard"] as? Bool { cfg.pasteFailureKeepDictationInClipboard = value }
 
+        lastPersisted = cfg
+        lastSyncedModificationDate = modified
         return cfg
     }
 
@@ -50,14 +61,27 @@ public final class JSONConfigStore: ConfigStoreProtocol {
         lock.lock()
         defer { lock.unlock() }
 
+        let exists = FileManager.default.fileExists(atPath: path.path)
+        // Only skip when the file is still the one we last wrote or read; a hand
+        // edit since then must be overwritten so file and memory agree again.
+        if exists, config == lastPersisted, let modified = modificationDate(), modified == lastSyncedModificationDate {
+            return
+        }
+
         var preserve: [String: Any] = [:]
-        if FileManager.default.fileExists(atPath: path.path) {
+        if exists {
             let data = try Data(contentsOf: path)
             if let obj = try JSONSerialization.jsonObject(with: data) as? [String: Any] {
                 preserve = obj
             }
         }
         try saveUnlocked(config, preserve: preserve)
+        lastPersisted = config
+        lastSyncedModificationDate = modificationDate()
+    }
+
+    private func modificationDate() -> Date? {
+        (try? FileManager.default.attributesOfItem(atPath: path.path))?[.modificationDate] as? Date
     }
 
     private func saveUnlocked(_ config: AppConfig, preserve: [String: Any]) throws {
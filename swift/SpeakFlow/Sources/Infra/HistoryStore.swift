@@ -2,30 +2,53 @@ import Domain
 import Foundation
 import SQLite3
 
-public final class SQLiteHistoryStore: HistoryStoreProtocol {
-    private let dbURL: URL
-    private let queue = DispatchQueue(label: "com.speakflow.history", qos: .userInitiated)
+public final class SQLiteHistoryStore: HistoryStoreProtocol, @unchecked Sendable {
+    private let writer: OpaquePointer
+    private let reader: OpaquePointer
+    private let writerStatements: StatementCache
+    private let readerStatements: StatementCache
+    private let writeQueue = DispatchQueue(label: "com.speakflow.history.write", qos: .userInitiated)
+    private let readQueue = DispatchQueue(label: "com.speakflow.history.read", qos: .userInitiated)
+    /// Only used on `writeQueue`.
+    private let timestampFormatter = ISO8601DateFormatter()
 
     public init(dbURL: URL = SpeakFlowPaths.historySQLite) throws {
-        self.dbURL = dbURL
         try ensureAppSupportDirectories()
-        try initializeSchema()
+        let writer = try Self.openConnection(at: dbURL, readOnly: false)
+        do {
+            try Self.initializeSchema(writer)
+            // Opened after the schema exists; WAL lets it read while the writer commits.
+            reader = try Self.openConnection(at: dbURL, readOnly: true)
+        } catch {
+            sqlite3_close(writer)
+            throw error
+        }
+        self.writer = writer
+        writerStatements = StatementCache(db: writer)
+        readerStatements = StatementCache(db: reader)
+    }
+
+    deinit {
+        // Connections refuse to close while they still own prepared statements.
+        readerStatements.finalizeAll()
+        writerStatements.finalizeAll()
+        sqlite3_close(reader)
+        sqlite3_close(writer)
     }
 
     public func add(rawText: String, finalText: String, detectedLanguage: String?, confidence: Double?, outputMode: String, sourceApp: String?) throws {
-        try queue.sync {
+        try writeQueue.sync {
             let sql = """
             INSERT INTO transcripts (
               created_at, raw_text, final_text, detected_language, confidence, output_mode, source_app
             ) VALUES (?, ?, ?, ?, ?, ?, ?)
             """
-            let now = ISO8601DateFormatter().string(from: Date())
-            try withDB { db in
-                var stmt: OpaquePointer?
-                guard sqlite3_prepare_v2(db, sql, -1, &stmt, nil) == SQLITE_OK else {
+            let now = timestampFormatter.string(from: Date())
+            try withWriteTransaction { statements in
+                guard let stmt = statements.prepared(sql) else {
                     throw SpeakFlowError.storageFailure("prepare insert failed")
                 }
-                defer { sqlite3_finalize(stmt) }
+                defer { sqlite3_reset(stmt) }
                 sqlite3_bind_text(stmt, 1, (now as NSString).utf8String, -1, SQLITE_TRANSIENT)
                 sqlite3_bind_text(stmt, 2, (rawText as NSString).utf8String, -1, SQLITE_TRANSIENT)
                 sqlite3_bind_text(stmt, 3, (finalText as NSString).utf8String, -1, SQLITE_TRANSIENT)
@@ -52,44 +75,57 @@ public final class SQLiteHistoryStore: HistoryStoreProtocol {
         }
     }
 
-    public func search(query: String, limit: Int, offset: Int) throws -> [HistoryRecord] {
-        try queue.sync {
+    public func search(query: String, limit: Int, beforeID: Int?) throws -> [HistoryRecord] {
+        try readQueue.sync {
             var records: [HistoryRecord] = []
             let trimmed = query.trimmingCharacters(in: .whitespacesAndNewlines)
+            let match = ftsMatchExpression(for: trimmed)
             let sql: String
             if trimmed.isEmpty {
                 sql = """
                 SELECT id, created_at, raw_text, final_text, detected_language, confidence, output_mode, source_app
-                FROM transcripts ORDER BY id DESC LIMIT ? OFFSET ?
+                FROM transcripts WHERE id < ? ORDER BY id DESC LIMIT ?
+                """
+            } else if match != nil {
+                sql = """
+                SELECT id, created_at, raw_text, final_text, detected_language, confidence, output_mode, source_app
+                FROM transcripts
+                WHERE id < ? AND id IN (SELECT rowid FROM transcripts_fts WHERE transcripts_fts MATCH ?)
+                ORDER BY id DESC LIMIT ?
                 """
             } else {
                 sql = """
                 SELECT id, created_at, raw_text, final_text, detected_language, confidence, output_mode, source_app
                 FROM transcripts
-                WHERE raw_text LIKE ? OR final_text LIKE ? OR COALESCE(source_app, '') LIKE ?
-                ORDER BY id DESC LIMIT ? OFFSET ?
+                WHERE id < ?1 AND (
+                    raw_text LIKE ?2 ESCAPE '\\'
+                    OR final_text LIKE ?2 ESCAPE '\\'
+                    OR COALESCE(source_app, '') LIKE ?2 ESCAPE '\\'
+                )
+                ORDER BY id DESC LIMIT ?3
                 """
             }
 
-            try withDB { db in
-                var stmt: OpaquePointer?
-                guard sqlite3_prepare_v2(db, sql, -1, &stmt, nil) == SQLITE_OK else {
+            try withReader { statements in
+                guard let stmt = statements.prepared(sql) else {
                     throw SpeakFlowError.storageFailure("prepare search failed")
                 }
-                defer { sqlite3_finalize(stmt) }
+                defer { sqlite3_reset(stmt) }
 
+                // Keyset cursor: the id of the last row already shown, or "no upper bound".
+                sqlite3_bind_int64(stmt, 1, Int64(beforeID ?? Int.max))
                 if trimmed.isEmpty {
-                    sqlite3_bind_int(stmt, 1, Int32(limit))
-                    sqlite3_bind_int(stmt, 2, Int32(offset))
+                    sqlite3_bind_int(stmt, 2, Int32(limit))
+                } else if let match {
+                    sqlite3_bind_text(stmt, 2, (match as NSString).utf8String, -1, SQLITE_TRANSIENT)
+                    sqlite3_bind_int(stmt, 3, Int32(limit))
                 } else {
-                    let like = "%\(trimmed)%"
-                    sqlite3_bind_text(stmt, 1, (like as NSString).utf8String, -1, SQLITE_TRANSIENT)
+                    let like = "%\(likeEscaped(trimmed))%"
                     sqlite3_bind_text(stmt, 2, (like as NSString).utf8String, -1, SQLITE_TRANSIENT)
-                    sqlite3_bind_text(stmt, 3, (like as NSString).utf8String, -1, SQLITE_TRANSIENT)
-                    sqlite3_bind_int(stmt, 4, Int32(limit))
-                    sqlite3_bind_int(stmt, 5, Int32(offset))
+                    sqlite3_bind_int(stmt, 3, Int32(limit))
                 }
 
+                records.reserveCapacity(max(0, min(limit, 1_000)))
                 while sqlite3_step(stmt) == SQLITE_ROW {
                     let id = Int(sqlite3_column_int(stmt, 0))
                     let createdAt = stringColumn(stmt, 1)
@@ -118,14 +154,12 @@ public final class SQLiteHistoryStore: HistoryStoreProtocol {
     }
 
     public func delete(id: Int) throws {
-        try queue.sync {
-            try withDB { db in
-                var stmt: OpaquePointer?
-                let sql = "DELETE FROM transcripts WHERE id = ?"
-                guard sqlite3_prepare_v2(db, sql, -1, &stmt, nil) == SQLITE_OK else {
+        try writeQueue.sync {
+            try withWriteTransaction { statements in
+                guard let stmt = statements.prepared("DELETE FROM transcripts WHERE id = ?") else {
                     throw SpeakFlowError.storageFailure("prepare delete failed")
                 }
-                defer { sqlite3_finalize(stmt) }
+                defer { sqlite3_reset(stmt) }
                 sqlite3_bind_int(stmt, 1, Int32(id))
                 guard sqlite3_step(stmt) == SQLITE_DONE else {
                     throw SpeakFlowError.storageFailure("delete failed")
@@ -135,42 +169,40 @@ public final class SQLiteHistoryStore: HistoryStoreProtocol {
     }
 
     public func stats() throws -> HistoryStats {
-        try queue.sync {
+        try readQueue.sync {
             var total = 0
             var latestCreated = ""
             var latestApp = "Unknown"
             var topApp = "Unknown"
             var topCount = 0
 
-            try withDB { db in
-                var stmt: OpaquePointer?
-                guard sqlite3_prepare_v2(db, "SELECT COUNT(*) FROM transcripts", -1, &stmt, nil) == SQLITE_OK else {
-                    throw SpeakFlowError.storageFailure("prepare total failed")
-                }
-                defer { sqlite3_finalize(stmt) }
-                if sqlite3_step(stmt) == SQLITE_ROW {
-                    total = Int(sqlite3_column_int(stmt, 0))
-                }
-
-                var latest: OpaquePointer?
-                guard sqlite3_prepare_v2(db, "SELECT created_at, COALESCE(source_app, 'Unknown') FROM transcripts ORDER BY id DESC LIMIT 1", -1, &latest, nil) == SQLITE_OK else {
-                    throw SpeakFlowError.storageFailure("prepare latest failed")
-                }
-                defer { sqlite3_finalize(latest) }
-                if sqlite3_step(latest) == SQLITE_ROW {
-                    latestCreated = stringColumn(latest, 0)
-                    latestApp = stringColumn(latest, 1)
+            try withReader { statements in
+                let sql = """
+                SELECT
+                    (SELECT COUNT(*) FROM transcripts),
+                    latest.created_at, latest.app_name,
+                    top.app_name, top.c
+                FROM (SELECT 1)
+                LEFT JOIN (
+                    SELECT created_at, COALESCE(source_app, 'Unknown') AS app_name
+                    FROM transcripts ORDER BY id DESC LIMIT 1
+                ) AS latest
+                LEFT JOIN (
+                    SELECT COALESCE(source_app, 'Unknown') AS app_name, COUNT(*) AS c
+                    FROM transcripts GROUP BY app_name ORDER BY c DESC LIMIT 1
+                ) AS top
+                """
+                guard let stmt = statements.prepared(sql) else {
+                    throw SpeakFlowError.storageFailure("prepare stats failed")
                 }
+                defer { sqlite3_reset(stmt) }
+                guard sqlite3_step(stmt) == SQLITE_ROW else { return }
 
-                var top: OpaquePointer?
-                guard sqlite3_prepare_v2(db, "SELECT COALESCE(source_app, 'Unknown') as app_name, COUNT(*) as c FROM transcripts GROUP BY app_name ORDER BY c DESC LIMIT 1", -1, &top, nil) == SQLITE_OK else {
-                    throw SpeakFlowError.storageFailure("prepare top app failed")
-                }
-                defer { sqlite3_finalize(top) }
-                if sqlite3_step(top) == SQLITE_ROW {
-                    topApp = stringColumn(top, 0)
-                    topCount = Int(sqlite3_column_int(top, 1))
-                }
+                total = Int(sqlite3_column_int(stmt, 0))
+                latestCreated = optionalStringColumn(stmt, 1) ?? latestCreated
+                latestApp = optionalStringColumn(stmt, 2) ?? latestApp
+                topApp = optionalStringColumn(stmt, 3) ?? topApp
+                topCount = Int(sqlite3_column_int(stmt, 4))
             }
 
             return HistoryStats(
@@ -183,8 +215,25 @@ public final class SQLiteHistoryStore: HistoryStoreProtocol {
         }
     }
 
-    private func initializeSchema() throws {
-        try withDB { db in
+    /// Bumped whenever `initializeSchema` gains a step; stored in `PRAGMA user_version`.
+    private static let schemaVersion: Int32 = 1
+
+    private static func initializeSchema(_ db: OpaquePointer) throws {
+        var version: OpaquePointer?
+        guard sqlite3_prepare_v2(db, "PRAGMA user_version", -1, &version, nil) == SQLITE_OK else {
+            throw SpeakFlowError.storageFailure("prepare schema version failed")
+        }
+        let currentVersion = sqlite3_step(version) == SQLITE_ROW ? sqlite3_column_int(version, 0) : 0
+        sqlite3_finalize(version)
+        // Already migrated: skip re-parsing the DDL below on every launch.
+        guard currentVersion < schemaVersion else { return }
+
+        // One transaction for the whole upgrade, version stamp included, so a
+        // crash part-way leaves the old version behind and the next launch retries.
+        guard sqlite3_exec(db, "BEGIN IMMEDIATE;", nil, nil, nil) == SQLITE_OK else {
+            throw SpeakFlowError.storageFailure("begin schema upgrade failed")
+        }
+        do {
             let schema = """
             CREATE TABLE IF NOT EXISTS transcripts (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -196,30 +245,162 @@ public final class SQLiteHistoryStore: HistoryStoreProtocol {
                 output_mode TEXT NOT NULL,
                 source_app TEXT
             );
-            CREATE INDEX IF NOT EXISTS idx_transcripts_created_at ON transcripts(created_at DESC);
+            DROP INDEX IF EXISTS idx_transcripts_created_at;
+            CREATE INDEX IF NOT EXISTS idx_transcripts_source_app ON transcripts(COALESCE(source_app, 'Unknown'));
             """
             guard sqlite3_exec(db, schema, nil, nil, nil) == SQLITE_OK else {
                 throw SpeakFlowError.storageFailure("schema init failed")
             }
+
+            let fts = """
+            CREATE VIRTUAL TABLE IF NOT EXISTS transcripts_fts USING fts5(
+                raw_text, final_text, source_app,
+                content='transcripts', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            );
+            CREATE TRIGGER IF NOT EXISTS transcripts_fts_ai AFTER INSERT ON transcripts BEGIN
+                INSERT INTO transcripts_fts(rowid, raw_text, final_text, source_app)
+                VALUES (new.id, new.raw_text, new.final_text, new.source_app);
+            END;
+            CREATE TRIGGER IF NOT EXISTS transcripts_fts_ad AFTER DELETE ON transcripts BEGIN
+                INSERT INTO transcripts_fts(transcripts_fts, rowid, raw_text, final_text, source_app)
+                VALUES ('delete', old.id, old.raw_text, old.final_text, old.source_app);
+            END;
+            CREATE TRIGGER IF NOT EXISTS transcripts_fts_au AFTER UPDATE ON transcripts BEGIN
+                INSERT INTO transcripts_fts(transcripts_fts, rowid, raw_text, final_text, source_app)
+                VALUES ('delete', old.id, old.raw_text, old.final_text, old.source_app);
+                INSERT INTO transcripts_fts(rowid, raw_text, final_text, source_app)
+                VALUES (new.id, new.raw_text, new.final_text, new.source_app);
+            END;
+            """
+            guard sqlite3_exec(db, fts, nil, nil, nil) == SQLITE_OK else {
+                throw SpeakFlowError.storageFailure("fts init failed")
+            }
+            // Index rows written before the FTS table existed. Keyed off user_version,
+            // not table existence, so an interrupted upgrade is redone in full.
+            guard sqlite3_exec(db, "INSERT INTO transcripts_fts(transcripts_fts) VALUES ('rebuild');", nil, nil, nil) == SQLITE_OK else {
+                throw SpeakFlowError.storageFailure("fts rebuild failed")
+            }
+
+            guard sqlite3_exec(db, "PRAGMA user_version = \(schemaVersion);", nil, nil, nil) == SQLITE_OK else {
+                throw SpeakFlowError.storageFailure("schema version update failed")
+            }
+            guard sqlite3_exec(db, "COMMIT;", nil, nil, nil) == SQLITE_OK else {
+                throw SpeakFlowError.storageFailure("commit schema upgrade failed")
+            }
+        } catch {
+            sqlite3_exec(db, "ROLLBACK;", nil, nil, nil)
+            throw error
         }
     }
 
-    private func withDB<T>(_ body: (OpaquePointer) throws -> T) throws -> T {
-        var db: OpaquePointer?
-        guard sqlite3_open_v2(dbURL.path, &db, SQLITE_OPEN_CREATE | SQLITE_OPEN_READWRITE | SQLITE_OPEN_FULLMUTEX, nil) == SQLITE_OK,
-              let db else {
+    /// Builds an FTS5 prefix query (`"tok"* "tok"*`) from the search box text,
+    /// or nil when it has no indexable tokens and LIKE should be used instead.
+    private func ftsMatchExpression(for query: String) -> String? {
+        let terms = query
+            .split { !$0.isLetter && !$0.isNumber }
+            .map { "\"\($0)\"*" }
+        return terms.isEmpty ? nil : terms.joined(separator: " ")
+    }
+
+    /// Escapes LIKE wildcards so punctuation-only searches such as `%` or `_`
+    /// match literally instead of matching every row.
+    private func likeEscaped(_ text: String) -> String {
+        var escaped = ""
+        escaped.reserveCapacity(text.count)
+        for character in text {
+            if character == "\\" || character == "%" || character == "_" {
+                escaped.append("\\")
+            }
+            escaped.append(character)
+        }
+        return escaped
+    }
+
+    // Writes run on `writeQueue`, reads on `readQueue`; each connection is only
+    // ever touched from its own queue.
+    // BEGIN IMMEDIATE takes the write lock up front instead of upgrading a
+    // deferred transaction mid-statement, which is where SQLITE_BUSY comes from.
+    private func withWriteTransaction<T>(_ body: (StatementCache) throws -> T) throws -> T {
+        guard sqlite3_exec(writer, "BEGIN IMMEDIATE;", nil, nil, nil) == SQLITE_OK else {
+            throw SpeakFlowError.storageFailure("begin write failed")
+        }
+        do {
+            let result = try body(writerStatements)
+            guard sqlite3_exec(writer, "COMMIT;", nil, nil, nil) == SQLITE_OK else {
+                throw SpeakFlowError.storageFailure("commit failed")
+            }
+            return result
+        } catch {
+            sqlite3_exec(writer, "ROLLBACK;", nil, nil, nil)
+            throw error
+        }
+    }
+
+    private func withReader<T>(_ body: (StatementCache) throws -> T) throws -> T {
+        try body(readerStatements)
+    }
+
+    private static func openConnection(at url: URL, readOnly: Bool) throws -> OpaquePointer {
+        let mode = readOnly ? SQLITE_OPEN_READONLY : (SQLITE_OPEN_CREATE | SQLITE_OPEN_READWRITE)
+        var handle: OpaquePointer?
+        guard sqlite3_open_v2(url.path, &handle, mode | SQLITE_OPEN_FULLMUTEX, nil) == SQLITE_OK,
+              let handle else {
+            sqlite3_close(handle)
             throw SpeakFlowError.storageFailure("open sqlite failed")
         }
-        defer { sqlite3_close(db) }
-        sqlite3_exec(db, "PRAGMA journal_mode=WAL;", nil, nil, nil)
-        sqlite3_exec(db, "PRAGMA busy_timeout=5000;", nil, nil, nil)
-        return try body(db)
+        if !readOnly {
+            // NORMAL is durable across app crashes in WAL mode and drops the per-commit fsync.
+            sqlite3_exec(handle, "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;", nil, nil, nil)
+        }
+        sqlite3_exec(
+            handle,
+            "PRAGMA busy_timeout=5000; PRAGMA cache_size=-20000; PRAGMA temp_store=MEMORY; PRAGMA mmap_size=268435456;",
+            nil, nil, nil
+        )
+        return handle
+    }
+}
+
+/// Prepared statements for one connection, keyed by SQL text, so hot queries
+/// (search-as-you-type, stats refresh, inserts) are parsed once per launch.
+/// Only touched from the queue that owns the connection; callers reset a
+/// statement when done with it.
+private final class StatementCache {
+    private let db: OpaquePointer
+    private var statements: [String: OpaquePointer] = [:]
+
+    init(db: OpaquePointer) {
+        self.db = db
+    }
+
+    func prepared(_ sql: String) -> OpaquePointer? {
+        if let cached = statements[sql] {
+            return cached
+        }
+        var stmt: OpaquePointer?
+        guard sqlite3_prepare_v3(db, sql, -1, UInt32(SQLITE_PREPARE_PERSISTENT), &stmt, nil) == SQLITE_OK,
+              let stmt else {
+            sqlite3_finalize(stmt)
+            return nil
+        }
+        statements[sql] = stmt
+        return stmt
+    }
+
+    func finalizeAll() {
+        for stmt in statements.values {
+            sqlite3_finalize(stmt)
+        }
+        statements.removeAll()
     }
 }
 
 private func stringColumn(_ stmt: OpaquePointer?, _ index: Int32) -> String {
     guard let c = sqlite3_column_text(stmt, index) else { return "" }
-    return String(cString: c)
+    // column_bytes gives the length SQLite already knows, so decoding skips the strlen scan.
+    let length = Int(sqlite3_column_bytes(stmt, index))
+    return String(decoding: UnsafeBufferPointer(start: c, count: length), as: UTF8.self)
 }
 
 private func optionalStringColumn(_ stmt: OpaquePointer?, _ index: Int32) -> String? {
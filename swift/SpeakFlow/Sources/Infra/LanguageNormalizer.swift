@@ -1,57 +1,85 @@
 import Foundation
+import Synchronization
 
 enum LanguageNormalizer {
-    private static let multiSpace = try! NSRegularExpression(pattern: "\\s+", options: [])
-    private static let devanagariRegex = try! NSRegularExpression(pattern: "[\\u0900-\\u097F]", options: [])
+    private static let devanagariScalars: ClosedRange<UInt32> = 0x0900...0x097F
+    private static let transliterationCacheLimit = 512
+    /// Whisper repeats short phrases and fillers often enough that the ICU
+    /// transform is worth memoizing; cleared wholesale once it hits the limit.
+    private static let transliterationCache = Mutex<[String: String]>([:])
 
     static func decideOutputMode(languageMode: String, text: String, detectedLanguage: String?) -> String {
         if languageMode == "english" { return "english" }
         if languageMode == "hinglish_roman" { return "hinglish_roman" }
 
-        let hasDevanagari = devanagariRegex.firstMatch(
-            in: text,
-            options: [],
-            range: NSRange(location: 0, length: (text as NSString).length)
-        ) != nil
-        if hasDevanagari { return "hinglish_roman" }
+        if containsDevanagari(text) { return "hinglish_roman" }
         if detectedLanguage == "hi" { return "hinglish_roman" }
         return "english"
     }
 
     static func normalizeEnglish(_ text: String) -> String {
-        var out = collapseSpace(text)
-        if out.isEmpty { return out }
-        out = out.prefix(1).uppercased() + out.dropFirst()
-        if let last = out.last, ".!?".contains(last) {
-            return out
-        }
-        return out + "."
+        finishSentence(text)
     }
 
     static func normalizeHinglishRoman(_ text: String) -> String {
-        var out = text
-        out = transliterateDevanagariTokenByToken(out)
-        out = collapseSpace(out)
-        if out.isEmpty { return out }
-        out = out.prefix(1).uppercased() + out.dropFirst()
+        // Plain ASCII is already Latin without combining marks; skip the transform.
+        finishSentence(isASCII(text) ? text : transliterateDevanagariTokenByToken(text))
+    }
+
+    /// Collapses whitespace, capitalises the first letter and ensures terminal
+    /// punctuation while building the output once.
+    private static func finishSentence(_ text: String) -> String {
+        let words = text.split(whereSeparator: \.isWhitespace)
+        guard let first = words.first else { return "" }
+
+        var out = ""
+        out.reserveCapacity(text.utf8.count + 1)
+        out += first.prefix(1).uppercased()
+        out += first.dropFirst()
+        for word in words.dropFirst() {
+            out += " "
+            out += word
+        }
         if let last = out.last, ".!?".contains(last) {
             return out
         }
-        return out + "."
+        out += "."
+        return out
+    }
+
+    static func containsDevanagari(_ text: String) -> Bool {
+        guard !isASCII(text) else { return false }
+        return text.unicodeScalars.contains { devanagariScalars.contains($0.value) }
+    }
+
+    /// Byte scan over the UTF-8 view; English transcripts (the common case)
+    /// never need scalar decoding.
+    static func isASCII(_ text: String) -> Bool {
+        text.utf8.allSatisfy { $0 < 0x80 }
     }
 
     static func collapseSpace(_ text: String) -> String {
-        let ns = text as NSString
-        let range = NSRange(location: 0, length: ns.length)
-        let collapsed = multiSpace.stringByReplacingMatches(in: text, options: [], range: range, withTemplate: " ")
-        return collapsed.trimmingCharacters(in: .whitespacesAndNewlines)
+        text.split(whereSeparator: \.isWhitespace).joined(separator: " ")
     }
 
+    /// `kCFStringTransformToLatin` followed by `kCFStringTransformStripCombiningMarks`,
+    /// expressed as one ICU compound transform so the text is walked once.
+    private static let toLatinStrippingMarks = "Any-Latin; NFD; [:Nonspacing Mark:] Remove; NFC" as CFString
+
     private static func transliterateDevanagariTokenByToken(_ text: String) -> String {
+        if let cached = transliterationCache.withLock({ $0[text] }) {
+            return cached
+        }
         // Lightweight transliteration path for mixed-script utterances.
-        guard let transform = NSMutableString(string: text).mutableCopy() as? NSMutableString else { return text }
-        CFStringTransform(transform, nil, kCFStringTransformToLatin, false)
-        CFStringTransform(transform, nil, kCFStringTransformStripCombiningMarks, false)
-        return transform as String
+        let transform = NSMutableString(string: text)
+        guard CFStringTransform(transform, nil, toLatinStrippingMarks, false) else { return text }
+        let latin = transform as String
+        transliterationCache.withLock { cache in
+            if cache.count >= transliterationCacheLimit {
+                cache.removeAll(keepingCapacity: true)
+            }
+            cache[text] = latin
+        }
+        return latin
     }
 }
@@ -5,6 +5,7 @@ public enum SpeakFlowPaths {
         .appendingPathComponent("Library/Application Support/SpeakFlow", isDirectory: true)
     public static let configJSON = appSupport.appendingPathComponent("config.json")
     public static let historySQLite = appSupport.appendingPathComponent("history.sqlite3")
+    public static let scriptsDir = appSupport.appendingPathComponent("Scripts", isDirectory: true)
     public static let logsDir = FileManager.default.homeDirectoryForCurrentUser
         .appendingPathComponent("Library/Logs/SpeakFlow", isDirectory: true)
     public static let launchAgents = FileManager.default.homeDirectoryForCurrentUser
@@ -1,10 +1,16 @@
 import Domain
 import Foundation
 
-public final class KeychainSecretStore: SecretStoreProtocol {
+public final class KeychainSecretStore: SecretStoreProtocol, @unchecked Sendable {
     private let serviceName: String
     private let accountName: String
 
+    /// Each keychain read spawns `security`; the key is effectively never rotated
+    /// behind our back, so lookups are reused for `cacheTTL`. Guarded by `cacheLock`.
+    private static let cacheTTL: Duration = .seconds(60)
+    private let cacheLock = NSLock()
+    private var cachedKey: (value: String?, fetchedAt: ContinuousClock.Instant)?
+
     public init(serviceName: String = "com.speakflow.desktop", accountName: String = "groq_api_key") {
         self.serviceName = serviceName
         self.accountName = accountName
@@ -15,14 +21,22 @@ public final class KeychainSecretStore: SecretStoreProtocol {
             return env
         }
 
+        cacheLock.lock()
+        defer { cacheLock.unlock() }
+        let now = ContinuousClock.now
+        if let cachedKey, now - cachedKey.fetchedAt < Self.cacheTTL {
+            return cachedKey.value
+        }
+
         let (status, out, _) = runSecurity([
             "find-generic-password",
             "-s", serviceName,
             "-a", accountName,
             "-w"
         ])
-        guard status == 0 else { return nil }
-        return out.trimmingCharacters(in: .whitespacesAndNewlines)
+        let value = status == 0 ? out.trimmingCharacters(in: .whitespacesAndNewlines) : nil
+        cachedKey = (value, now)
+        return value
     }
 
     public func hasGroqAPIKey() -> Bool {
@@ -34,21 +48,40 @@ public final class KeychainSecretStore: SecretStoreProtocol {
         guard !trimmed.isEmpty else {
             throw SpeakFlowError.keychainFailure("API key cannot be empty")
         }
-        _ = try runSecurityOrThrow([
-            "add-generic-password",
-            "-U",
-            "-s", serviceName,
-            "-a", accountName,
-            "-w", trimmed
-        ])
+        do {
+            _ = try runSecurityOrThrow([
+                "add-generic-password",
+                "-U",
+                "-s", serviceName,
+                "-a", accountName,
+                "-w", trimmed
+            ])
+        } catch {
+            updateCache(nil)
+            throw error
+        }
+        // We just wrote it, so the next read needs no keychain round trip.
+        updateCache((trimmed, ContinuousClock.now))
     }
 
     public func deleteGroqAPIKey() throws {
-        _ = try? runSecurityOrThrow([
+        let deleted = (try? runSecurityOrThrow([
             "delete-generic-password",
             "-s", serviceName,
             "-a", accountName
-        ])
+        ])) != nil
+        if deleted {
+            updateCache((nil, ContinuousClock.now))
+        } else {
+            updateCache(nil)
+        }
+    }
+
+    /// Replaces the cached lookup; nil forces the next read to hit the keychain.
+    private func updateCache(_ entry: (value: String?, fetchedAt: ContinuousClock.Instant)?) {
+        cacheLock.lock()
+        cachedKey = entry
+        cacheLock.unlock()
     }
 
     private func runSecurityOrThrow(_ args: [String]) throws -> (String, String) {
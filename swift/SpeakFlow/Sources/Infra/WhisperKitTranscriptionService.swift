@@ -7,10 +7,17 @@ import Foundation
 
 public final class WhisperKitTranscriptionService: SpeechTranscriptionServiceProtocol, @unchecked Sendable {
     private let modelName: String
+    private let languageModeProvider: @Sendable () -> LanguageMode
     private nonisolated(unsafe) var cachedWhisper: Any?
 
-    public init(modelName: String = "large-v3") {
+    /// Defaults to the compressed large-v3 weights: same model, roughly half the
+    /// memory traffic per decode step on the Neural Engine.
+    public init(
+        modelName: String = "large-v3_947MB",
+        languageModeProvider: @escaping @Sendable () -> LanguageMode = { .auto }
+    ) {
         self.modelName = modelName
+        self.languageModeProvider = languageModeProvider
     }
 
     public func transcribe(_ audio: [Float]) async throws -> TranscriptResult {
@@ -37,28 +44,43 @@ public final class WhisperKitTranscriptionService: SpeechTranscriptionServicePro
             whisper = instance
         }
 
+        // A pinned English mode skips Whisper's language-ID pass. Hinglish keeps
+        // detection: forcing "hi" makes Whisper write English words in Devanagari.
+        let pinnedLanguage: String? = languageModeProvider() == .english ? "en" : nil
         let decode = DecodingOptions(
             verbose: false,
             task: .transcribe,
+            language: pinnedLanguage,
             usePrefillPrompt: true,
-            detectLanguage: true
+            detectLanguage: pinnedLanguage == nil
         )
         let results: [TranscriptionResult] = try await whisper.transcribe(audioArray: audio, decodeOptions: decode)
-        let text = results
-            .map(\.text)
-            .joined(separator: " ")
-            .trimmingCharacters(in: CharacterSet.whitespacesAndNewlines)
+        // Trim, join and count Devanagari per result in one walk, so the joined
+        // transcript is not rescanned for the mixed-script check.
+        var parts: [String] = []
+        parts.reserveCapacity(results.count)
+        var devanagariCount = 0
+        for result in results {
+            let part = result.text.trimmingCharacters(in: CharacterSet.whitespacesAndNewlines)
+            guard !part.isEmpty else { continue }
+            parts.append(part)
+            devanagariCount += devanagariScalarCount(part)
+        }
+        let text = parts.joined(separator: " ")
         let detectedLanguage = results.first?.language
-        let avgLogprob = results
-            .flatMap(\.segments)
-            .map(\.avgLogprob)
-            .reduce(0.0, +) / Float(max(1, results.flatMap(\.segments).count))
+        var logprobSum: Float = 0
+        var segmentCount = 0
+        for segment in results.lazy.flatMap(\.segments) {
+            logprobSum += segment.avgLogprob
+            segmentCount += 1
+        }
+        let avgLogprob = logprobSum / Float(max(1, segmentCount))
         let confidence = max(0.0, min(1.0, exp(Double(avgLogprob))))
         return TranscriptResult(
             rawText: text,
             detectedLanguage: detectedLanguage,
             confidence: confidence,
-            isMixedScript: mixedScriptRatio(text) >= 0.07
+            isMixedScript: devanagariCount > 0 && Double(devanagariCount) / Double(text.count) >= 0.07
         )
         #else
         throw SpeakFlowError.transcriptionFailed(
@@ -67,10 +89,10 @@ public final class WhisperKitTranscriptionService: SpeechTranscriptionServicePro
         #endif
     }
 
-    private func mixedScriptRatio(_ text: String) -> Double {
-        guard !text.isEmpty else { return 0 }
-        let total = Double(text.count)
-        let devCount = Double(text.unicodeScalars.filter { (0x0900...0x097F).contains(Int($0.value)) }.count)
-        return devCount / total
+    private func devanagariScalarCount(_ text: String) -> Int {
+        guard !LanguageNormalizer.isASCII(text) else { return 0 }
+        return text.unicodeScalars.reduce(into: 0) { count, scalar in
+            if (0x0900...0x097F).contains(scalar.value) { count += 1 }
+        }
     }
 }
@@ -20,21 +20,33 @@ public final class AutoStartService: AutoStartServiceProtocol {
             "ProcessType": "Interactive",
         ]
         let data = try PropertyListSerialization.data(fromPropertyList: plist, format: .xml, options: 0)
+        if (try? Data(contentsOf: SpeakFlowPaths.launchAgentPlist)) == data,
+           runLaunchctl(["print", "gui/\(getuid())/\(label)"]) == 0 {
+            return
+        }
         try data.write(to: SpeakFlowPaths.launchAgentPlist)
 
-        let process = Process()
-        process.executableURL = URL(fileURLWithPath: "/bin/launchctl")
-        process.arguments = ["bootstrap", "gui/\(getuid())", SpeakFlowPaths.launchAgentPlist.path]
-        try? process.run()
-        process.waitUntilExit()
+        runLaunchctl(["bootstrap", "gui/\(getuid())", SpeakFlowPaths.launchAgentPlist.path])
     }
 
     public func uninstallLaunchAgent() throws {
+        runLaunchctl(["bootout", "gui/\(getuid())", SpeakFlowPaths.launchAgentPlist.path])
+        try? FileManager.default.removeItem(at: SpeakFlowPaths.launchAgentPlist)
+    }
+
+    @discardableResult
+    private func runLaunchctl(_ arguments: [String]) -> Int32 {
         let process = Process()
         process.executableURL = URL(fileURLWithPath: "/bin/launchctl")
-        process.arguments = ["bootout", "gui/\(getuid())", SpeakFlowPaths.launchAgentPlist.path]
-        try? process.run()
-        process.waitUntilExit()
-        try? FileManager.default.removeItem(at: SpeakFlowPaths.launchAgentPlist)
+        process.arguments = arguments
+        process.standardOutput = FileHandle.nullDevice
+        process.standardError = FileHandle.nullDevice
+        do {
+            try process.run()
+            process.waitUntilExit()
+            return process.terminationStatus
+        } catch {
+            return -1
+        }
     }
 }
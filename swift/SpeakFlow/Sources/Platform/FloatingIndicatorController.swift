@@ -103,34 +103,49 @@ public final class FloatingIndicatorController {
 
         switch state {
         case .hidden:
-            panel.orderOut(nil)
+            hide()
         case let .recording(level):
-            label.stringValue = "Recording"
+            setLabel("Recording")
             meter.doubleValue = Double(level)
             show()
         case .transcribing:
-            label.stringValue = "Transcribing"
+            setLabel("Transcribing")
             meter.doubleValue = 0
             show()
         case let .done(message):
-            label.stringValue = message
+            setLabel(message)
             meter.doubleValue = 0
             showThenHide()
         case let .error(message):
-            label.stringValue = message
+            setLabel(message)
             meter.doubleValue = 0
             showThenHide()
         }
     }
 
+    /// The meter calls update(state:) 20 times a second while recording;
+    /// only touch the field when the text actually changes.
+    private func setLabel(_ text: String) {
+        if label.stringValue != text {
+            label.stringValue = text
+        }
+    }
+
     private func show() {
+        // Repeated show or hide calls (e.g. every meter tick) skip the window server.
+        guard !panel.isVisible else { return }
         panel.orderFront(nil)
     }
 
+    private func hide() {
+        guard panel.isVisible else { return }
+        panel.orderOut(nil)
+    }
+
     private func showThenHide() {
         show()
         let task = DispatchWorkItem { [weak self] in
-            self?.panel.orderOut(nil)
+            self?.hide()
         }
         hideTask = task
         DispatchQueue.main.asyncAfter(deadline: .now() + hideDelay, execute: task)
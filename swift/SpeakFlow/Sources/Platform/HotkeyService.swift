@@ -16,6 +16,11 @@ public final class HotkeyService: HotkeyServiceProtocol, @unchecked Sendable {
     private var fnDown = false
     private var comboDown = false
 
+    private static let trackedModifiers: CGEventFlags = [.maskSecondaryFn, .maskCommand, .maskAlternate, .maskShift, .maskControl]
+    private static let pasteLastModifiers: CGEventFlags = [.maskCommand, .maskAlternate]
+    private static let vKeycode: Int64 = 9
+    private static let spaceKeycode: Int64 = 49
+
     public init() {}
 
     public func setHandlers(
@@ -29,6 +34,19 @@ public final class HotkeyService: HotkeyServiceProtocol, @unchecked Sendable {
     }
 
     public func start(mode: HotkeyMode) {
+        if let runLoop, eventTap != nil {
+            // Already listening: switch modes on the tap thread rather than
+            // tearing down and recreating the thread, run loop and event tap.
+            CFRunLoopPerformBlock(runLoop, CFRunLoopMode.commonModes.rawValue) { [weak self] in
+                guard let self, self.mode != mode else { return }
+                self.mode = mode
+                self.fnDown = false
+                self.comboDown = false
+            }
+            CFRunLoopWakeUp(runLoop)
+            return
+        }
+
         stop()
         self.mode = mode
         thread = Thread { [weak self] in
@@ -95,11 +113,11 @@ public final class HotkeyService: HotkeyServiceProtocol, @unchecked Sendable {
             return Unmanaged.passRetained(event)
         }
 
-        let keycode = Int(event.getIntegerValueField(.keyboardEventKeycode))
+        let keycode = event.getIntegerValueField(.keyboardEventKeycode)
         let flags = event.flags
-        let modifiers = flags.intersection([.maskSecondaryFn, .maskCommand, .maskAlternate, .maskShift, .maskControl])
 
-        if type == .keyDown && keycode == 9 && modifiers == [.maskCommand, .maskAlternate] {
+        if type == .keyDown && keycode == Self.vKeycode
+            && flags.intersection(Self.trackedModifiers) == Self.pasteLastModifiers {
             if onPasteLast?() == true {
                 return nil
             }
@@ -127,15 +145,16 @@ public final class HotkeyService: HotkeyServiceProtocol, @unchecked Sendable {
         }
     }
 
-    private func handleFnSpace(type: CGEventType, fnPressed: Bool, keycode: Int) {
-        if type == .keyDown && keycode == 49 && fnPressed {
+    private func handleFnSpace(type: CGEventType, fnPressed: Bool, keycode: Int64) {
+        guard keycode == Self.spaceKeycode else { return }
+        if type == .keyDown && fnPressed {
             if !comboDown {
                 comboDown = true
                 onPress?()
             }
             return
         }
-        if type == .keyUp && keycode == 49 && comboDown {
+        if type == .keyUp && comboDown {
             comboDown = false
             onRelease?()
         }
@@ -11,11 +11,25 @@ public final class PermissionService: PermissionServiceProtocol, @unchecked Send
     }
 
     public func checkAll() -> PermissionState {
-        PermissionState(
-            microphone: checkMicrophone(),
-            accessibility: checkAccessibility(),
-            inputMonitoring: checkInputMonitoring(),
-            automation: checkAutomation()
+        final class FlagBox: @unchecked Sendable { var value = false }
+
+        // The automation probe spawns osascript; run it alongside the in-process
+        // checks so the total is the slowest probe, not the sum.
+        let automation = FlagBox()
+        let group = DispatchGroup()
+        DispatchQueue.global(qos: .userInitiated).async(group: group) { [self] in
+            automation.value = checkAutomation()
+        }
+        let microphone = checkMicrophone()
+        let accessibility = checkAccessibility()
+        let inputMonitoring = checkInputMonitoring()
+        group.wait()
+
+        return PermissionState(
+            microphone: microphone,
+            accessibility: accessibility,
+            inputMonitoring: inputMonitoring,
+            automation: automation.value
         )
     }
 
@@ -11,7 +11,8 @@ public final class SingleInstanceLock {
 
     public func acquire() -> Bool {
         try? ensureAppSupportDirectories()
-        fd = open(lockURL.path, O_CREAT | O_RDWR, 0o644)
+        // CLOEXEC keeps the lock out of the osascript/security children we spawn.
+        fd = open(lockURL.path, O_CREAT | O_RDWR | O_CLOEXEC, 0o644)
         guard fd >= 0 else { return false }
         if flock(fd, LOCK_EX | LOCK_NB) != 0 {
             close(fd)
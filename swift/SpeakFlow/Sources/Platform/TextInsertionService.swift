@@ -1,6 +1,7 @@
 import AppKit
 import Domain
 import Foundation
+import Infra
 import Quartz
 
 public final class TextInsertionService: TextInsertionServiceProtocol, @unchecked Sendable {
@@ -9,6 +10,41 @@ public final class TextInsertionService: TextInsertionServiceProtocol, @unchecke
     private let setClipboardOverride: ((String) -> Void)?
     private let pasteSystemOverride: ((Int32?) -> Bool)?
     private let pasteQuartzOverride: (() -> Bool)?
+    private let restoreDelay: TimeInterval
+    private let restoreQueue: DispatchQueue
+
+    /// Serializes the deferred restore against the next insert's clipboard swap.
+    private let restoreLock = NSLock()
+    private var pendingRestore: (id: UInt64, original: String, pasted: String)?
+    private var nextRestoreID: UInt64 = 0
+
+    private let pasteEventLock = NSLock()
+    private var pasteEvents: (down: CGEvent, up: CGEvent)?
+
+    private let scriptLock = NSLock()
+    private var compiledScripts: [String: URL?] = [:]
+
+    /// Takes the target PID as an optional argument so one compiled copy serves every paste.
+    private static let pasteScriptSource = """
+        on run argv
+          tell application "System Events"
+            if (count of argv) > 0 then
+              try
+                set targetProc to first process whose unix id is ((item 1 of argv) as integer)
+                if frontmost of targetProc then
+                  tell targetProc to keystroke "v" using command down
+                  return
+                end if
+              end try
+            end if
+            keystroke "v" using command down
+          end tell
+        end run
+        """
+
+    private static let preflightScriptSource = """
+        tell application "System Events" to get name of first process
+        """
 
     public init(pasteRetry: Int = 1) {
         self.pasteRetry = max(0, pasteRetry)
@@ -16,6 +52,8 @@ public final class TextInsertionService: TextInsertionServiceProtocol, @unchecke
         self.setClipboardOverride = nil
         self.pasteSystemOverride = nil
         self.pasteQuartzOverride = nil
+        self.restoreDelay = 0.2
+        self.restoreQueue = .global(qos: .utility)
     }
 
     init(
@@ -23,13 +61,17 @@ public final class TextInsertionService: TextInsertionServiceProtocol, @unchecke
         getClipboard: @escaping () -> String,
         setClipboard: @escaping (String) -> Void,
         pasteSystem: @escaping (Int32?) -> Bool,
-        pasteQuartz: @escaping () -> Bool
+        pasteQuartz: @escaping () -> Bool,
+        restoreDelay: TimeInterval = 0.2,
+        restoreQueue: DispatchQueue = .global(qos: .utility)
     ) {
         self.pasteRetry = max(0, pasteRetry)
         self.getClipboardOverride = getClipboard
         self.setClipboardOverride = setClipboard
         self.pasteSystemOverride = pasteSystem
         self.pasteQuartzOverride = pasteQuartz
+        self.restoreDelay = restoreDelay
+        self.restoreQueue = restoreQueue
     }
 
     public func insert(text: String, targetPID: Int32?, restoreClipboard: Bool, keepOnFailure: Bool) -> InsertResult {
@@ -38,15 +80,21 @@ public final class TextInsertionService: TextInsertionServiceProtocol, @unchecke
             return InsertResult(inserted: false, usedClipboardFallback: false, errorMessage: nil)
         }
 
+        restoreLock.lock()
+        // Put back the user's clipboard from an earlier paste first, so it (not the
+        // previous dictation) is what this insert saves and later restores.
+        completePendingRestoreLocked()
         let original = getClipboardText()
         setClipboardText(trimmed)
-        Thread.sleep(forTimeInterval: 0.05)
+        restoreLock.unlock()
+        waitForClipboard(toContain: trimmed, timeout: 0.05)
 
         let pasted = pasteWithRetry(targetPID: targetPID)
         if pasted {
             if restoreClipboard {
-                Thread.sleep(forTimeInterval: 0.2)
-                setClipboardText(original)
+                scheduleClipboardRestore(original, replacing: trimmed)
+            } else {
+                Thread.sleep(forTimeInterval: 0.06)
             }
             return InsertResult(inserted: true, usedClipboardFallback: false, errorMessage: nil)
         }
@@ -87,10 +135,45 @@ public final class TextInsertionService: TextInsertionServiceProtocol, @unchecke
         board.setString(text, forType: .string)
     }
 
+    /// Restores the clipboard once the target app has had time to read the
+    /// pasted text, without holding the caller for that delay.
+    private func scheduleClipboardRestore(_ original: String, replacing pasted: String) {
+        restoreLock.lock()
+        nextRestoreID &+= 1
+        let id = nextRestoreID
+        pendingRestore = (id, original, pasted)
+        restoreLock.unlock()
+
+        restoreQueue.asyncAfter(deadline: .now() + restoreDelay) { [self] in
+            restoreLock.lock()
+            defer { restoreLock.unlock() }
+            // A later insert already completed or replaced this restore.
+            guard pendingRestore?.id == id else { return }
+            completePendingRestoreLocked()
+        }
+    }
+
+    /// Caller holds `restoreLock`.
+    private func completePendingRestoreLocked() {
+        guard let pending = pendingRestore else { return }
+        pendingRestore = nil
+        // Something else (e.g. the user copying) took the clipboard meanwhile.
+        guard getClipboardText() == pending.pasted else { return }
+        setClipboardText(pending.original)
+    }
+
+    /// Polls until the pasteboard reads back `text`, instead of a fixed sleep.
+    private func waitForClipboard(toContain text: String, timeout: TimeInterval) {
+        let deadline = Date().addingTimeInterval(timeout)
+        while getClipboardText() != text && Date() < deadline {
+            Thread.sleep(forTimeInterval: 0.001)
+        }
+    }
+
     private func pasteWithRetry(targetPID: Int32?) -> Bool {
         for attempt in 0...pasteRetry {
-            if pasteWithSystemEvents(targetPID: targetPID) || pasteWithQuartz() {
-                Thread.sleep(forTimeInterval: 0.06)
+            // In-process Quartz first; the System Events round trip is only a fallback.
+            if pasteWithQuartz() || pasteWithSystemEvents(targetPID: targetPID) {
                 return true
             }
             if attempt < pasteRetry {
@@ -104,56 +187,54 @@ public final class TextInsertionService: TextInsertionServiceProtocol, @unchecke
         if let pasteSystemOverride {
             return pasteSystemOverride(targetPID)
         }
-        var script = "tell application \"System Events\" to keystroke \"v\" using command down"
-        if let targetPID {
-            script = """
-            tell application "System Events"
-              try
-                set targetProc to first process whose unix id is \(targetPID)
-                if frontmost of targetProc then
-                  tell targetProc to keystroke "v" using command down
-                else
-                  keystroke "v" using command down
-                end if
-              on error
-                keystroke "v" using command down
-              end try
-            end tell
-            """
-        }
-        let process = Process()
-        process.executableURL = URL(fileURLWithPath: "/usr/bin/osascript")
-        process.arguments = ["-e", script]
-        do {
-            try process.run()
-            process.waitUntilExit()
-            return process.terminationStatus == 0
-        } catch {
-            return false
-        }
+        let arguments = targetPID.map { [String($0)] } ?? []
+        return runAppleScript(named: "paste", source: Self.pasteScriptSource, arguments: arguments)
     }
 
     private func pasteWithQuartz() -> Bool {
         if let pasteQuartzOverride {
             return pasteQuartzOverride()
         }
-        guard
-            let down = CGEvent(keyboardEventSource: nil, virtualKey: 9, keyDown: true),
-            let up = CGEvent(keyboardEventSource: nil, virtualKey: 9, keyDown: false)
-        else {
+        // Without Accessibility trust the posted events are silently dropped,
+        // so report failure and let the AppleScript path handle it.
+        guard AXIsProcessTrusted() else {
             return false
         }
-        down.flags = .maskCommand
-        up.flags = .maskCommand
-        down.post(tap: .cghidEventTap)
-        up.post(tap: .cghidEventTap)
+
+        pasteEventLock.lock()
+        defer { pasteEventLock.unlock() }
+        if pasteEvents == nil {
+            guard
+                let down = CGEvent(keyboardEventSource: nil, virtualKey: 9, keyDown: true),
+                let up = CGEvent(keyboardEventSource: nil, virtualKey: 9, keyDown: false)
+            else {
+                return false
+            }
+            pasteEvents = (down, up)
+        }
+        guard let events = pasteEvents else { return false }
+        // Flags are reset each time in case a previous post left them altered.
+        events.down.flags = .maskCommand
+        events.up.flags = .maskCommand
+        events.down.post(tap: .cgSessionEventTap)
+        events.up.post(tap: .cgSessionEventTap)
         return true
     }
 
     public func preflightAutomationPermission() -> Bool {
+        runAppleScript(named: "preflight", source: Self.preflightScriptSource)
+    }
+
+    /// Runs a script through osascript, from a copy compiled once per launch
+    /// when possible so each call skips AppleScript compilation.
+    private func runAppleScript(named name: String, source: String, arguments: [String] = []) -> Bool {
         let process = Process()
         process.executableURL = URL(fileURLWithPath: "/usr/bin/osascript")
-        process.arguments = ["-e", "tell application \"System Events\" to get name of first process"]
+        if let compiled = compiledScript(named: name, source: source) {
+            process.arguments = [compiled.path] + arguments
+        } else {
+            process.arguments = ["-e", source] + arguments
+        }
         do {
             try process.run()
             process.waitUntilExit()
@@ -162,4 +243,32 @@ public final class TextInsertionService: TextInsertionServiceProtocol, @unchecke
             return false
         }
     }
+
+    private func compiledScript(named name: String, source: String) -> URL? {
+        scriptLock.lock()
+        defer { scriptLock.unlock() }
+        if let cached = compiledScripts[name] {
+            return cached
+        }
+
+        // Recompiled on first use each launch so an updated source never runs stale bytecode.
+        var compiled: URL?
+        let url = SpeakFlowPaths.scriptsDir.appendingPathComponent("\(name).scpt")
+        let process = Process()
+        process.executableURL = URL(fileURLWithPath: "/usr/bin/osacompile")
+        process.arguments = ["-o", url.path, "-e", source]
+        do {
+            try FileManager.default.createDirectory(at: SpeakFlowPaths.scriptsDir, withIntermediateDirectories: true)
+            try process.run()
+            process.waitUntilExit()
+            if process.terminationStatus == 0 {
+                compiled = url
+            }
+        } catch {
+            AppLogger.error("Failed to compile \(name) script: \(error.localizedDescription)")
+        }
+        // Failures are cached too, so a broken osacompile is not retried on every paste.
+        compiledScripts.updateValue(compiled, forKey: name)
+        return compiled
+    }
 }
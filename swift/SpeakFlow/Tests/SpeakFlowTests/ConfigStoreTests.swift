@@ -33,4 +33,40 @@ struct ConfigStoreTests {
         #expect(obj?["lmstudio_auto_start"] as? Bool == false)
         #expect(obj?["lmstudio_start_timeout_ms"] as? Int == 12000)
     }
+
+    @Test func saveSkipsRewriteWhenConfigUnchanged() throws {
+        let dir = URL(fileURLWithPath: NSTemporaryDirectory()).appendingPathComponent(UUID().uuidString, isDirectory: true)
+        try FileManager.default.createDirectory(at: dir, withIntermediateDirectories: true)
+        let path = dir.appendingPathComponent("config.json")
+
+        let store = JSONConfigStore(path: path)
+        var cfg = try store.load()
+        let fileNumber = { try FileManager.default.attributesOfItem(atPath: path.path)[.systemFileNumber] as? Int }
+
+        let initial = try fileNumber()
+        try store.save(cfg)
+        #expect(try fileNumber() == initial)
+
+        cfg.languageMode = .english
+        try store.save(cfg)
+        #expect(try fileNumber() != initial)
+        #expect(try store.load().languageMode == .english)
+    }
+
+    @Test func saveRewritesFileEditedSinceLastSync() throws {
+        let dir = URL(fileURLWithPath: NSTemporaryDirectory()).appendingPathComponent(UUID().uuidString, isDirectory: true)
+        try FileManager.default.createDirectory(at: dir, withIntermediateDirectories: true)
+        let path = dir.appendingPathComponent("config.json")
+
+        let store = JSONConfigStore(path: path)
+        let cfg = try store.load()
+
+        try #"{"language_mode": "english"}"#.data(using: .utf8)?.write(to: path)
+        try FileManager.default.setAttributes([.modificationDate: Date(timeIntervalSince1970: 0)], ofItemAtPath: path.path)
+        try store.save(cfg)
+
+        let raw = try Data(contentsOf: path)
+        let obj = try JSONSerialization.jsonObject(with: raw) as? [String: Any]
+        #expect(obj?["language_mode"] as? String == cfg.languageMode.rawValue)
+    }
 }
@@ -1,5 +1,6 @@
 import Foundation
 import Infra
+import SQLite3
 import Testing
 
 struct HistoryStoreTests {
@@ -12,16 +13,82 @@ struct HistoryStoreTests {
         try store.add(rawText: "hello", finalText: "Hello.", detectedLanguage: "en", confidence: 0.9, outputMode: "english", sourceApp: "Notes")
         try store.add(rawText: "bhai kya", finalText: "Bhai kya?", detectedLanguage: "hi", confidence: 0.8, outputMode: "hinglish_roman", sourceApp: "Slack")
 
-        let rows = try store.search(query: "bhai", limit: 10, offset: 0)
+        let rows = try store.search(query: "bhai", limit: 10, beforeID: nil)
         #expect(rows.count == 1)
         #expect(rows[0].sourceApp == "Slack")
 
+        let page = try store.search(query: "", limit: 1, beforeID: nil)
+        #expect(page.map(\.sourceApp) == ["Slack"])
+        let nextPage = try store.search(query: "", limit: 1, beforeID: page[0].id)
+        #expect(nextPage.map(\.sourceApp) == ["Notes"])
+
         let stats = try store.stats()
         #expect(stats.totalCount == 2)
         #expect(!stats.topSourceApp.isEmpty)
 
         try store.delete(id: rows[0].id)
-        let afterDelete = try store.search(query: "", limit: 10, offset: 0)
+        let afterDelete = try store.search(query: "", limit: 10, beforeID: nil)
         #expect(afterDelete.count == 1)
     }
+
+    @Test func searchMatchesWordPrefixesAndTracksDeletes() throws {
+        let dir = URL(fileURLWithPath: NSTemporaryDirectory()).appendingPathComponent(UUID().uuidString, isDirectory: true)
+        try FileManager.default.createDirectory(at: dir, withIntermediateDirectories: true)
+        let db = dir.appendingPathComponent("history.sqlite3")
+
+        let store = try SQLiteHistoryStore(dbURL: db)
+        try store.add(rawText: "hello world", finalText: "Hello world.", detectedLanguage: "en", confidence: 0.9, outputMode: "english", sourceApp: "Notes")
+        try store.add(rawText: "ship it", finalText: "Ship it.", detectedLanguage: "en", confidence: 0.9, outputMode: "english", sourceApp: "Slack")
+
+        #expect(try store.search(query: "hel wor", limit: 10, beforeID: nil).count == 1)
+        #expect(try store.search(query: "%", limit: 10, beforeID: nil).isEmpty)
+        let bySource = try store.search(query: "sla", limit: 10, beforeID: nil)
+        #expect(bySource.count == 1)
+
+        try store.delete(id: bySource[0].id)
+        #expect(try store.search(query: "sla", limit: 10, beforeID: nil).isEmpty)
+    }
+
+    @Test func reopeningStoreSkipsSchemaSetupAndKeepsRows() throws {
+        let dir = URL(fileURLWithPath: NSTemporaryDirectory()).appendingPathComponent(UUID().uuidString, isDirectory: true)
+        try FileManager.default.createDirectory(at: dir, withIntermediateDirectories: true)
+        let db = dir.appendingPathComponent("history.sqlite3")
+
+        do {
+            let store = try SQLiteHistoryStore(dbURL: db)
+            try store.add(rawText: "hello world", finalText: "Hello world.", detectedLanguage: "en", confidence: 0.9, outputMode: "english", sourceApp: "Notes")
+        }
+
+        // Drop an index the schema DDL would recreate; it must stay gone if setup is skipped.
+        #expect(try sqliteScalar(db, "PRAGMA user_version") == 1)
+        try sqliteExec(db, "DROP INDEX idx_transcripts_source_app")
+
+        let reopened = try SQLiteHistoryStore(dbURL: db)
+        #expect(try sqliteScalar(db, "SELECT COUNT(*) FROM sqlite_master WHERE name = 'idx_transcripts_source_app'") == 0)
+        #expect(try reopened.search(query: "hello", limit: 10, beforeID: nil).count == 1)
+        #expect(try reopened.stats().totalCount == 1)
+    }
+
+    private func sqliteExec(_ url: URL, _ sql: String) throws {
+        var db: OpaquePointer?
+        defer { sqlite3_close(db) }
+        guard sqlite3_open(url.path, &db) == SQLITE_OK, sqlite3_exec(db, sql, nil, nil, nil) == SQLITE_OK else {
+            throw CocoaError(.fileWriteUnknown)
+        }
+    }
+
+    private func sqliteScalar(_ url: URL, _ sql: String) throws -> Int32 {
+        var db: OpaquePointer?
+        var stmt: OpaquePointer?
+        defer {
+            sqlite3_finalize(stmt)
+            sqlite3_close(db)
+        }
+        guard sqlite3_open(url.path, &db) == SQLITE_OK,
+              sqlite3_prepare_v2(db, sql, -1, &stmt, nil) == SQLITE_OK,
+              sqlite3_step(stmt) == SQLITE_ROW else {
+            throw CocoaError(.fileReadUnknown)
+        }
+        return sqlite3_column_int(stmt, 0)
+    }
 }
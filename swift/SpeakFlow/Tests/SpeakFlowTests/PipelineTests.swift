@@ -10,7 +10,7 @@ struct PipelineTests {
             added.append(finalText)
         }
 
-        func search(query: String, limit: Int, offset: Int) throws -> [HistoryRecord] { [] }
+        func search(query: String, limit: Int, beforeID: Int?) throws -> [HistoryRecord] { [] }
         func delete(id: Int) throws {}
         func stats() throws -> HistoryStats {
             HistoryStats(totalCount: 0, latestCreatedAt: "", latestSourceApp: "Unknown", topSourceApp: "Unknown", topSourceAppCount: 0)
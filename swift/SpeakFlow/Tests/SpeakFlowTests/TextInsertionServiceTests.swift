@@ -4,12 +4,13 @@ import Testing
 @testable import Platform
 
 struct TextInsertionServiceTests {
-    @Test func insertSuccessRestoresClipboard() {
+    @Test func insertSuccessRestoresClipboardAfterDelay() async {
         final class Box: @unchecked Sendable {
             var clipboard = "original"
             var pasteAttempts = 0
         }
         let box = Box()
+        let restoreQueue = DispatchQueue(label: "TextInsertionServiceTests.restore")
 
         let service = TextInsertionService(
             pasteRetry: 0,
@@ -19,9 +20,13 @@ struct TextInsertionServiceTests {
                 box.pasteAttempts += 1
                 return true
             },
-            pasteQuartz: { false }
+            pasteQuartz: { false },
+            restoreDelay: 0.01,
+            restoreQueue: restoreQueue
         )
 
+        // Held until resumed, so nothing can restore before the checks below.
+        restoreQueue.suspend()
         let result = service.insert(
             text: "hello",
             targetPID: nil,
@@ -31,6 +36,63 @@ struct TextInsertionServiceTests {
 
         #expect(result.inserted)
         #expect(box.pasteAttempts == 1)
+        #expect(box.clipboard == "hello")
+
+        restoreQueue.resume()
+        await drain(restoreQueue, after: 0.05)
+        #expect(box.clipboard == "original")
+    }
+
+    @Test func restoreSkippedWhenClipboardChangedMeanwhile() async {
+        final class Box: @unchecked Sendable {
+            var clipboard = "original"
+        }
+        let box = Box()
+        let restoreQueue = DispatchQueue(label: "TextInsertionServiceTests.restore")
+
+        let service = TextInsertionService(
+            pasteRetry: 0,
+            getClipboard: { box.clipboard },
+            setClipboard: { box.clipboard = $0 },
+            pasteSystem: { _ in true },
+            pasteQuartz: { false },
+            restoreDelay: 0.01,
+            restoreQueue: restoreQueue
+        )
+
+        restoreQueue.suspend()
+        _ = service.insert(text: "hello", targetPID: nil, restoreClipboard: true, keepOnFailure: true)
+        box.clipboard = "copied elsewhere"
+
+        restoreQueue.resume()
+        await drain(restoreQueue, after: 0.05)
+        #expect(box.clipboard == "copied elsewhere")
+    }
+
+    @Test func backToBackInsertsKeepOriginalClipboard() async {
+        final class Box: @unchecked Sendable {
+            var clipboard = "original"
+        }
+        let box = Box()
+        let restoreQueue = DispatchQueue(label: "TextInsertionServiceTests.restore")
+
+        let service = TextInsertionService(
+            pasteRetry: 0,
+            getClipboard: { box.clipboard },
+            setClipboard: { box.clipboard = $0 },
+            pasteSystem: { _ in true },
+            pasteQuartz: { false },
+            restoreDelay: 0.01,
+            restoreQueue: restoreQueue
+        )
+
+        restoreQueue.suspend()
+        _ = service.insert(text: "one", targetPID: nil, restoreClipboard: true, keepOnFailure: true)
+        _ = service.insert(text: "two", targetPID: nil, restoreClipboard: true, keepOnFailure: true)
+        #expect(box.clipboard == "two")
+
+        restoreQueue.resume()
+        await drain(restoreQueue, after: 0.05)
         #expect(box.clipboard == "original")
     }
 
@@ -85,4 +147,40 @@ struct TextInsertionServiceTests {
         #expect(result.usedClipboardFallback == false)
         #expect(box.clipboard == "before")
     }
+
+    @Test func insertUsesQuartzBeforeSystemEvents() {
+        final class Box: @unchecked Sendable {
+            var clipboard = "before"
+            var systemAttempts = 0
+        }
+        let box = Box()
+
+        let service = TextInsertionService(
+            pasteRetry: 0,
+            getClipboard: { box.clipboard },
+            setClipboard: { box.clipboard = $0 },
+            pasteSystem: { _ in
+                box.systemAttempts += 1
+                return true
+            },
+            pasteQuartz: { true }
+        )
+
+        let result = service.insert(
+            text: "hello",
+            targetPID: nil,
+            restoreClipboard: false,
+            keepOnFailure: true
+        )
+
+        #expect(result.inserted)
+        #expect(box.systemAttempts == 0)
+    }
+
+    /// Returns once `queue` has run everything scheduled on it before `delay` elapses.
+    private func drain(_ queue: DispatchQueue, after delay: TimeInterval) async {
+        await withCheckedContinuation { continuation in
+            queue.asyncAfter(deadline: .now() + delay) { continuation.resume() }
+        }
+    }
 }